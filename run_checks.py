@@ -11,16 +11,26 @@
 # https://www.apache.org/licenses/LICENSE-2.0
 
 # /// script
-# dependencies = ["pre-commit==4.2"]
+# dependencies = ["pre-commit==4.2", "requests>=2.32"]
 # ///
 
+import concurrent.futures
+import functools
+import hashlib
+import json
+import os
+import re
+import shutil
 import subprocess
 import sys
 import tempfile
-import urllib.error
-import urllib.request
+import threading
+import types
+import urllib.parse
+import weakref
 from pathlib import Path
-import argparse
+
+import requests
 
 # Default to 'main' branch, but can be overridden via environment variable or argument
 DEFAULT_BRANCH = "main"
@@ -35,50 +45,199 @@ HOOK_SCRIPT_URL_TEMPLATE = f"{REPO_BASE_URL}/pre-commit-action/reuse-annotate-ho
 TEMPLATE_URL_TEMPLATE = f"{REPO_BASE_URL}/.reuse/templates/{{template}}.jinja2"
 LICENSE_URL_TEMPLATE = f"{REPO_BASE_URL}/LICENSES/{{license}}.txt"
 
+# sha256 of pre-commit-action/reuse-annotate-hook.sh per branch. A matching
+# cached copy is trusted without revalidation, and a downloaded copy that
+# doesn't match aborts the run (defense against a tampered download).
+# Update the hash whenever the hook script changes on main.
+EXPECTED_HOOK_SHA256 = {
+    "main": "f41f69c42045311c7928562d4afa3985030a6334b145f113cfa49b022d077814",
+}
+
+# Shared session so all downloads reuse one pooled TLS connection to
+# raw.githubusercontent.com; Session.get() is thread-safe, so the
+# concurrent fetches in main() can share it.
+SESSION = requests.Session()
+
+
+# Matches the ruff hook args that differ between fix and check-only mode.
+# The patterns are bytes so downloaded content never needs a decode/encode
+# round-trip just to be patched.
+_CONFIG_PATTERN = re.compile(rb"args: \[(--output-format=full|--diff)\]")
+# Matches the ${REUSE_*:-default} env var expansions in the hook script
+_HOOK_PATTERN = re.compile(rb"\$\{REUSE_(COPYRIGHT|LICENSE|TEMPLATE):-[^}]*\}")
+
 
+@functools.lru_cache(maxsize=8)
 def patch_config(config_content, *, fix_mode):
-    """Patch the pre-commit config for fix mode vs check-only mode.
+    """Patch the pre-commit config (bytes) for fix mode vs check-only mode.
 
     In fix mode (local), ruff auto-fixes issues in place.
     In check-only mode (CI), ruff reports issues without modifying files.
     """
     if fix_mode:
-        # ruff-check: add --fix
-        config_content = config_content.replace(
-            "args: [--output-format=full]",
-            "args: [--fix, --output-format=full]",
-        )
-        # ruff-format: remove --diff so it formats in place
-        config_content = config_content.replace(
-            "args: [--diff]",
-            "args: []",
+        replacements = {
+            # ruff-check: add --fix
+            b"--output-format=full": b"args: [--fix, --output-format=full]",
+            # ruff-format: remove --diff so it formats in place
+            b"--diff": b"args: []",
+        }
+        # A single scan with one compiled pattern instead of one full
+        # string copy per replace()
+        config_content = _CONFIG_PATTERN.sub(
+            lambda m: replacements[m.group(1)], config_content
         )
 
     return config_content
 
 
 def patch_hook_script(script_content, *, copyright_text, license_id, template):
-    """Patch the reuse-annotate hook script with configured values.
+    """Patch the reuse-annotate hook script (bytes) with configured values.
 
     Replaces the env var defaults so the script uses the provided values
     directly, without depending on environment variables at runtime.
     """
-    script_content = script_content.replace(
-        "${REUSE_COPYRIGHT:-The Contributors to Eclipse OpenSOVD (see CONTRIBUTORS)}",
-        copyright_text,
-    )
-    script_content = script_content.replace(
-        "${REUSE_LICENSE:-Apache-2.0}",
-        license_id,
-    )
-    script_content = script_content.replace(
-        "${REUSE_TEMPLATE:-opensovd}",
-        template,
-    )
-    return script_content
+    replacements = {
+        b"COPYRIGHT": copyright_text.encode(),
+        b"LICENSE": license_id.encode(),
+        b"TEMPLATE": template.encode(),
+    }
+    return _HOOK_PATTERN.sub(lambda m: replacements[m.group(1)], script_content)
+
+
+@functools.cache
+def urls_for(branch, template, license_id):
+    """Return the download URLs for a branch, keyed by purpose."""
+    return {
+        "config": CONFIG_URL_TEMPLATE.format(branch=branch),
+        "hook": HOOK_SCRIPT_URL_TEMPLATE.format(branch=branch),
+        "template": TEMPLATE_URL_TEMPLATE.format(branch=branch, template=template),
+        "license": LICENSE_URL_TEMPLATE.format(branch=branch, license=license_id),
+    }
+
+
+def cache_dir_for(branch):
+    """Return the on-disk cache directory for downloads from a branch."""
+    root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return root / "opensovd-cicd" / urllib.parse.quote(branch, safe="")
+
+
+def cached_fetch(url, cache_dir, revalidate=True, expected_sha256=None):
+    """Fetch a URL into the on-disk cache and return the cached file path.
+
+    The body is streamed straight to disk in chunks, so the full payload is
+    never buffered in memory. Its ETag/Last-Modified headers are stored next
+    to it, keyed by URL, and later fetches send If-None-Match/
+    If-Modified-Since so an unchanged asset costs a cheap 304 instead of a
+    full transfer. With revalidate=False a cached body is trusted as-is and
+    no request is made at all (for immutable refs). If the cache directory
+    is unusable, the body is streamed to a temp file instead.
+
+    When expected_sha256 is given, a cached body is trusted only if it has
+    that digest, the fetch is always unconditional, and a downloaded body
+    that doesn't match the digest is discarded and raises RuntimeError, so
+    a rejected body can never enter the cache.
+    """
+    key = hashlib.sha256(url.encode()).hexdigest()
+    body_path = cache_dir / key
+    meta_path = cache_dir / f"{key}.meta"
+
+    if body_path.exists():
+        if expected_sha256:
+            # A cached body is only ever trusted when it matches the pin;
+            # anything else is refetched and re-verified below
+            digest = hashlib.sha256(body_path.read_bytes()).hexdigest()
+            if digest == expected_sha256:
+                return body_path
+        elif not revalidate:
+            return body_path
+
+    # Pinned fetches are always unconditional: a 304 would vouch for
+    # whatever body is cached, bypassing the digest check
+    headers = {}
+    if expected_sha256 is None and body_path.exists() and meta_path.exists():
+        try:
+            meta = json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            meta = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    with SESSION.get(url, headers=headers, stream=True, timeout=30) as response:
+        if response.status_code == 304:
+            return body_path
+        response.raise_for_status()
+        # Stream to a temp file and only move it into body_path once it is
+        # complete: the cache must never hold a partial body, because the
+        # pinned-SHA path trusts an existing body without a request, so an
+        # interrupted or concurrent run would otherwise serve a truncated
+        # file forever.
+        final_path = None
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            handle, name = tempfile.mkstemp(dir=cache_dir, prefix=f"{key}.")
+            final_path = body_path
+        except OSError:
+            # Cache is best-effort: fall back to a temp file that the
+            # OS will eventually reap.
+            handle, name = tempfile.mkstemp(prefix="opensovd-cicd-")
+        out_path = Path(name)
+        with os.fdopen(handle, "wb") as f:
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                f.write(chunk)
+        if expected_sha256:
+            digest = hashlib.sha256(out_path.read_bytes()).hexdigest()
+            if digest != expected_sha256:
+                # Never leave a rejected body (or metadata vouching for
+                # it) behind for later runs to trust
+                out_path.unlink(missing_ok=True)
+                meta_path.unlink(missing_ok=True)
+                raise RuntimeError(
+                    f"Checksum mismatch for {url}: "
+                    f"expected {expected_sha256}, got {digest}"
+                )
+        if final_path is not None:
+            os.replace(out_path, final_path)
+            out_path = final_path
+            # Written only after the body is in place, so a stored ETag
+            # always refers to a complete body
+            try:
+                meta_path.write_text(
+                    json.dumps(
+                        {
+                            "etag": response.headers.get("ETag"),
+                            "last_modified": response.headers.get("Last-Modified"),
+                        }
+                    )
+                )
+            except OSError:
+                pass
+        return out_path
+
+
+# Matches the remote hook repos pinned in the pre-commit config
+_REPO_PATTERN = re.compile(rb"^\s*-\s*repo:\s*(https?://\S+)", re.MULTILINE)
+
+
+def warm_hook_repos(config_content):
+    """Warm connections to the hook repos pinned in a pre-commit config.
+
+    Runs git ls-remote against each remote repo so DNS and TLS session
+    caches are primed while pre-commit itself is still starting up; the
+    clones it performs on a cold store then skip the serial connection
+    setup. Failures are irrelevant - pre-commit will report them properly.
+    """
+    for match in _REPO_PATTERN.finditer(config_content):
+        subprocess.run(
+            ["git", "ls-remote", match.group(1).decode(), "HEAD"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
 
 
-def download_if_missing(local_path, url, description):
+def download_if_missing(local_path, url, description, cache_dir, revalidate=True):
     """Download a file from url into local_path if it doesn't already exist.
 
     Returns cleanup info (file path + created directories) or None if skipped.
@@ -90,19 +249,14 @@ def download_if_missing(local_path, url, description):
     print(f"Downloading {description} from: {url}")
 
     # Track which directories we need to create so we can clean them up
-    created_dirs = []
-    check = local_path.parent
-    while check != Path("."):
-        if not check.exists():
-            created_dirs.append(check)
-        check = check.parent
+    created_dirs = [p for p in local_path.parents if p != Path(".") and not p.exists()]
 
     local_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        with urllib.request.urlopen(url) as response:
-            local_path.write_text(response.read().decode())
-    except urllib.error.HTTPError:
+        # No patching needed here, so copy the cached file byte-for-byte
+        shutil.copyfile(cached_fetch(url, cache_dir, revalidate), local_path)
+    except requests.HTTPError:
         print(
             f"Warning: Could not download {description} from {url}",
             file=sys.stderr,
@@ -112,121 +266,222 @@ def download_if_missing(local_path, url, description):
     return {"file": local_path, "dirs": sorted(created_dirs)}
 
 
-def cleanup_downloads(cleanup_list):
-    """Remove downloaded files and any directories we created."""
-    for cleanup_info in cleanup_list:
-        if cleanup_info is None:
-            continue
-        cleanup_info["file"].unlink(missing_ok=True)
-        # Remove directories we created, deepest first
-        for d in reversed(cleanup_info["dirs"]):
-            try:
-                d.rmdir()
-            except OSError:
-                pass  # Directory not empty or already removed
-
+USAGE = """\
+usage: run_checks.py [-h] [--copyright TEXT] [--license ID] [--template NAME]
+                     [--config PATH] [--hook-script PATH] [--no-fix] [branch]
+
+Run pre-commit checks with REUSE license header support
+
+positional arguments:
+  branch              Git branch to use for downloading configs (default: main)
+
+options:
+  -h, --help          show this help message and exit
+  --copyright TEXT    Copyright holder text for reuse annotate
+  --license ID        SPDX license identifier for reuse annotate
+  --template NAME     Name of reuse Jinja2 template in .reuse/templates/
+  --config PATH       Path to a local .pre-commit-config.yml (skips downloading)
+  --hook-script PATH  Path to a local reuse-annotate-hook.sh (skips downloading)
+  --no-fix            Run in check-only mode (no auto-fix). Used in CI to
+                      report issues without modifying files.\
+"""
+
+# Maps each value-taking option to its attribute on the parsed namespace
+# and its default. GitHub Actions passes "" for unset inputs, so an empty
+# value falls back to the default right at parse time.
+_OPTIONS = {
+    "--copyright": ("copyright", DEFAULT_COPYRIGHT),
+    "--license": ("license", DEFAULT_LICENSE),
+    "--template": ("template", DEFAULT_TEMPLATE),
+    "--config": ("config", None),
+    "--hook-script": ("hook_script", None),
+}
+
+
+def parse_args(argv):
+    """Parse command-line arguments into a namespace.
+
+    Hand-rolled instead of argparse: importing argparse costs tens of
+    milliseconds on a cold interpreter, a measurable share of the wrapper's
+    own overhead, and the handful of options here doesn't need more.
+    Options accept both --opt=value and --opt value.
+    """
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Run pre-commit checks with REUSE license header support"
-    )
-    parser.add_argument(
-        "branch",
-        nargs="?",
-        default=DEFAULT_BRANCH,
-        help="Git branch to use for downloading configs (default: main)",
-    )
-    parser.add_argument(
-        "--copyright",
-        default=DEFAULT_COPYRIGHT,
-        help=f"Copyright holder text for reuse annotate (default: {DEFAULT_COPYRIGHT})",
-    )
-    parser.add_argument(
-        "--license",
-        default=DEFAULT_LICENSE,
-        help=f"SPDX license identifier for reuse annotate (default: {DEFAULT_LICENSE})",
-    )
-    parser.add_argument(
-        "--template",
-        default=DEFAULT_TEMPLATE,
-        help=f"Name of reuse Jinja2 template in .reuse/templates/ (default: {DEFAULT_TEMPLATE})",
-    )
-    parser.add_argument(
-        "--config",
-        default=None,
-        help="Path to a local .pre-commit-config.yml (skips downloading from remote)",
-    )
-    parser.add_argument(
-        "--hook-script",
-        default=None,
-        help="Path to a local reuse-annotate-hook.sh (skips downloading from remote)",
-    )
-    parser.add_argument(
-        "--no-fix",
-        action="store_true",
-        help="Run in check-only mode (no auto-fix). Used in CI to report issues without modifying files.",
+    def fail(message):
+        print(USAGE, file=sys.stderr)
+        print(f"run_checks.py: error: {message}", file=sys.stderr)
+        sys.exit(2)
+
+    args = types.SimpleNamespace(
+        branch=DEFAULT_BRANCH,
+        copyright=DEFAULT_COPYRIGHT,
+        license=DEFAULT_LICENSE,
+        template=DEFAULT_TEMPLATE,
+        config=None,
+        hook_script=None,
+        no_fix=False,
     )
 
-    args = parser.parse_args()
+    positionals = []
+    remaining = iter(argv)
+    for arg in remaining:
+        key, sep, value = arg.partition("=")
+        if arg in ("-h", "--help"):
+            print(USAGE)
+            sys.exit(0)
+        elif arg == "--no-fix":
+            args.no_fix = True
+        elif key in _OPTIONS:
+            if not sep:
+                value = next(remaining, None)
+                # Don't swallow a following option as the value
+                if value is None or value.startswith("-"):
+                    fail(f"argument {key}: expected one argument")
+            attr, default = _OPTIONS[key]
+            setattr(args, attr, value or default)
+        elif arg.startswith("-"):
+            fail(f"unrecognized argument: {arg}")
+        else:
+            positionals.append(arg)
+
+    if len(positionals) > 1:
+        fail(f"unrecognized argument: {positionals[1]}")
+    if positionals:
+        args.branch = positionals[0]
 
-    # Treat empty strings as unset (GitHub Actions passes "" for unset inputs)
-    if not args.copyright:
-        args.copyright = DEFAULT_COPYRIGHT
-    if not args.license:
-        args.license = DEFAULT_LICENSE
-    if not args.template:
-        args.template = DEFAULT_TEMPLATE
+    return args
+
+
+class _CleanupToken:
+    """Sentinel that owns a cleanup callback registered via weakref.finalize."""
+
+
+def register_cleanup(func, *args, **kwargs):
+    """Register an idempotent cleanup callback and return its owner token.
+
+    The callback fires when the token is garbage collected, at the latest
+    at interpreter shutdown, so it runs on every exit path without explicit
+    unwind code.
+    """
+    token = _CleanupToken()
+    weakref.finalize(token, func, *args, **kwargs)
+    return token
+
+
+def remove_download(cleanup_info):
+    """Remove a downloaded file and any directories created for it."""
+    cleanup_info["file"].unlink(missing_ok=True)
+    # Remove directories we created, deepest first
+    for d in reversed(cleanup_info["dirs"]):
+        try:
+            d.rmdir()
+        except OSError:
+            pass  # Directory not empty or already removed
+
+
+def main():
+    args = parse_args(sys.argv[1:])
 
     branch = args.branch
-    cleanup_list = []
     config_path = args.config
-    config_is_temp = False
+
+    # Cleanup is registered via weakref.finalize as each resource is
+    # created; the tokens live in these frame-local lists, so the
+    # idempotent finalizers fire on every exit path (normal return,
+    # sys.exit, or an unhandled error) without explicit unwind code.
+    workspace_cleanup = []
+    temp_cleanup = []
 
     try:
-        # Resolve pre-commit config: use local or download from remote
         fix_mode = not args.no_fix
 
-        if config_path is None:
-            config_url = CONFIG_URL_TEMPLATE.format(branch=branch)
-            print(f"Downloading pre-commit config from: {config_url}")
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".yml", delete=False
-            ) as f:
-                with urllib.request.urlopen(config_url) as response:
-                    config_content = response.read().decode()
-                config_content = patch_config(config_content, fix_mode=fix_mode)
-                f.write(config_content)
-                config_path = f.name
-            config_is_temp = True
-        else:
-            # Local config provided: always patch a temp copy to inject settings
-            config_content = Path(config_path).read_text()
-            config_content = patch_config(config_content, fix_mode=fix_mode)
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".yml", delete=False
-            ) as f:
-                f.write(config_content)
-                config_path = f.name
-            config_is_temp = True
-
-        # Resolve hook script: use local (--hook-script), CWD, or download.
-        # The script must end up at ./reuse-annotate-hook.sh (CWD) because
-        # the pre-commit config entry is: bash reuse-annotate-hook.sh
+        # The hook script must end up at ./reuse-annotate-hook.sh (CWD)
+        # because the pre-commit config entry is: bash reuse-annotate-hook.sh
         hook_cwd_path = Path("reuse-annotate-hook.sh")
         hook_existed_in_cwd = hook_cwd_path.exists()
 
+        # Run the downloads concurrently: they are independent and the time
+        # is dominated by network round-trips, so up to four GETs cost
+        # roughly one RTT instead of four.
+        config_future = None
+        hook_future = None
+        cache_dir = cache_dir_for(branch)
+        # A 40-hex branch argument is a pinned commit SHA, so its files are
+        # immutable: cached copies never go stale and repeat runs (e.g.
+        # matrix CI jobs) skip the network entirely.
+        revalidate = re.fullmatch(r"[0-9a-f]{40}", branch) is None
+        # The threads this wrapper spawns (the fetchers here, the store
+        # warmer later) only do light I/O, so trim their stack reservation
+        # from the platform default (commonly 8 MB each) to 512 KiB
+        threading.stack_size(512 * 1024)
+        urls = urls_for(branch, args.template, args.license)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            if config_path is None:
+                print(f"Downloading pre-commit config from: {urls['config']}")
+                config_future = executor.submit(
+                    cached_fetch, urls["config"], cache_dir, revalidate
+                )
+
+            if not args.hook_script and not hook_existed_in_cwd:
+                print(f"Downloading reuse-annotate hook script from: {urls['hook']}")
+                hook_future = executor.submit(
+                    cached_fetch,
+                    urls["hook"],
+                    cache_dir,
+                    revalidate,
+                    expected_sha256=EXPECTED_HOOK_SHA256.get(branch),
+                )
+
+            # Ensure REUSE assets are available locally
+            template_future = executor.submit(
+                download_if_missing,
+                f".reuse/templates/{args.template}.jinja2",
+                urls["template"],
+                f"reuse template '{args.template}'",
+                cache_dir,
+                revalidate,
+            )
+
+            license_future = executor.submit(
+                download_if_missing,
+                f"LICENSES/{args.license}.txt",
+                urls["license"],
+                f"license text '{args.license}'",
+                cache_dir,
+                revalidate,
+            )
+
+        # Resolve pre-commit config: downloaded or local
+        if config_future is not None:
+            cached_config = config_future.result()
+            config_content = cached_config.read_bytes()
+            config_path = str(cached_config)
+        else:
+            config_content = Path(config_path).read_bytes()
+
+        # Patch a temp copy to inject settings, but only when patching
+        # actually changes something (it doesn't in check-only mode);
+        # otherwise pre-commit can read the existing file directly.
+        patched_config = patch_config(config_content, fix_mode=fix_mode)
+        if patched_config != config_content:
+            # Temp assets share one directory, removed with a single rmtree
+            temp_dir = Path(tempfile.mkdtemp(prefix="opensovd-cicd-"))
+            temp_cleanup.append(
+                register_cleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+            )
+            config_file = temp_dir / "pre-commit-config.yml"
+            config_file.write_bytes(patched_config)
+            config_path = str(config_file)
+
+        # Resolve hook script: local (--hook-script), CWD, or downloaded
         if args.hook_script:
             # Explicit path provided (e.g. from GitHub Action)
-            script_content = Path(args.hook_script).read_text()
+            script_content = Path(args.hook_script).read_bytes()
         elif hook_existed_in_cwd:
             # Already in CWD (e.g. running inside this repo)
-            script_content = hook_cwd_path.read_text()
+            script_content = hook_cwd_path.read_bytes()
         else:
-            # Download from remote
-            hook_url = HOOK_SCRIPT_URL_TEMPLATE.format(branch=branch)
-            print(f"Downloading reuse-annotate hook script from: {hook_url}")
-            with urllib.request.urlopen(hook_url) as response:
-                script_content = response.read().decode()
+            script_content = hook_future.result().read_bytes()
 
         # Patch env var defaults with configured values and write to CWD
         patched = patch_hook_script(
@@ -235,59 +490,61 @@ def main():
             license_id=args.license,
             template=args.template,
         )
-        hook_cwd_path.write_text(patched)
+        hook_cwd_path.write_bytes(patched)
 
         # Clean up if we created the file (downloaded or copied from elsewhere)
         if not hook_existed_in_cwd:
-            cleanup_list.append({"file": hook_cwd_path, "dirs": []})
-
-        # Ensure REUSE assets are available locally
-        template_url = TEMPLATE_URL_TEMPLATE.format(
-            branch=branch, template=args.template
-        )
-        cleanup_list.append(
-            download_if_missing(
-                f".reuse/templates/{args.template}.jinja2",
-                template_url,
-                f"reuse template '{args.template}'",
+            workspace_cleanup.append(
+                register_cleanup(hook_cwd_path.unlink, missing_ok=True)
             )
-        )
 
-        license_url = LICENSE_URL_TEMPLATE.format(branch=branch, license=args.license)
-        cleanup_list.append(
-            download_if_missing(
-                f"LICENSES/{args.license}.txt",
-                license_url,
-                f"license text '{args.license}'",
-            )
-        )
+        for cleanup_info in (template_future.result(), license_future.result()):
+            if cleanup_info is not None:
+                workspace_cleanup.append(
+                    register_cleanup(remove_download, cleanup_info)
+                )
 
         print("Running pre-commit checks...")
-        result = subprocess.run(
-            ["pre-commit", "run", "--all-files", "--config", config_path],
-            check=False,
+        # pre-commit parallelizes hooks across CPUs by default; make sure an
+        # inherited PRE_COMMIT_NO_CONCURRENCY doesn't silently serialize the
+        # hook phase, which dominates the total runtime.
+        env = os.environ.copy()
+        env.pop("PRE_COMMIT_NO_CONCURRENCY", None)
+        cmd = ["pre-commit", "run", "--all-files", "--config", config_path]
+
+        if not workspace_cleanup:
+            # Nothing to remove from the workspace afterwards (hook script
+            # and REUSE assets were already present), so replace this
+            # process with pre-commit instead of forking a child and idling
+            # until it exits. Signals like Ctrl-C then reach pre-commit
+            # directly and the wrapper's interpreter is freed. The temp
+            # config lives in /tmp, where the OS reaps it.
+            os.execvpe(cmd[0], cmd, env)
+
+        proc = subprocess.Popen(cmd, env=env)
+
+        # While pre-commit boots, warm its hook repos' remotes in the
+        # background - but only when its store is cold and the clones are
+        # still ahead; on warm runs the extra requests would be wasted.
+        store = Path(
+            env.get("PRE_COMMIT_HOME")
+            or Path(env.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "pre-commit"
         )
+        if not store.exists():
+            threading.Thread(
+                target=warm_hook_repos, args=(patched_config,), daemon=True
+            ).start()
 
-        # Clean up
-        if config_is_temp:
-            Path(config_path).unlink(missing_ok=True)
-        cleanup_downloads(cleanup_list)
-        sys.exit(result.returncode)
-    except urllib.error.HTTPError as e:
+        sys.exit(proc.wait())
+    except requests.HTTPError as e:
         print(f"Error downloading config: {e}", file=sys.stderr)
         print(
             f"Make sure the branch '{branch}' exists in the repository.",
             file=sys.stderr,
         )
-        if config_is_temp and config_path:
-            Path(config_path).unlink(missing_ok=True)
-        cleanup_downloads(cleanup_list)
         sys.exit(1)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
-        if config_is_temp and config_path:
-            Path(config_path).unlink(missing_ok=True)
-        cleanup_downloads(cleanup_list)
         sys.exit(1)
 
 